@@ -6,132 +6,443 @@ Finds PNGs in ./img, trims transparent margins, pads to a square (centered), res
 and writes results as PNGs into ./icons.
 
 Usage:
-    python Icomaker.py [--src img] [--dst icons] [--size 256] [--overwrite] [--tolerance 0]
+    python Icomaker.py [--src img] [--dst icons] [--size 256] [--overwrite] [--tolerance 0] [--compress-level 1]
+                       [--jobs 0]
 
-Requirements: pillow
+Requirements: pillow, numpy (optional: opencv-python for faster downscaling,
+              numba for faster --tolerance matching)
 """
 from __future__ import annotations
 
 import argparse
+import functools
+import logging
+import logging.handlers
+import math
+import multiprocessing as mp
 import os
+import shutil
+import struct
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple
+from typing import Iterator, List, Tuple
 
+import numpy as np
+import PIL
 from PIL import Image
 
+try:
+    import cv2
+except ImportError:  # OpenCV is optional; Pillow does the resizing without it
+    cv2 = None
+else:
+    # Keep OpenCV's own [ WARN ] lines (e.g. for truncated files) off stderr;
+    # failures are reported per file anyway. libpng may still print its own error
+    cv2.utils.logging.setLogLevel(cv2.utils.logging.LOG_LEVEL_ERROR)
+
+try:
+    from numba import njit, prange, set_num_threads
+except ImportError:  # Numba is optional; tolerance matching falls back to NumPy
+    njit = None
+
+
+log = logging.getLogger("icomaker")
 
 DEFAULT_SIZE = 256
 
+# zlib level for the written PNGs. Icons are small, so the fast end of the
+# range costs little in file size compared to Pillow's default of 6
+DEFAULT_COMPRESS_LEVEL = 1
+
+# An RGBA pixel read as one little-endian word: R is the low byte, A the high byte
+RGBA_WORD = np.dtype("<u4")
+RGB_MASK = np.uint32(0x00FFFFFF)
+
+# Large downscales first shrink by an integer factor with a box filter until
+# the source is within this factor of the target, then finish with LANCZOS.
+# Pillow documents 3.0 and up as indistinguishable from a full LANCZOS pass.
+REDUCING_GAP = 3.0
+
+# PNG file signature, and the IHDR colour types for greyscale and RGBA
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_COLOR_GRAY = 0
+PNG_COLOR_RGBA = 6
+
 
-def get_alpha_bbox(image: Image.Image) -> Tuple[int, int, int, int] | None:
-    """Return the bounding box (l, upper, r, lower) of areas where alpha > 0.
+def read_png_header(path: Path) -> Tuple[int, int, int, int] | None:
+    """Return (width, height, bit_depth, color_type) from the IHDR chunk.
 
-    If image has no alpha channel, return the image bbox (0,0,w,h). If
-    the image is fully transparent, return None.
+    Only the first 26 bytes are read; returns None if path is not a PNG.
     """
-    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
-        alpha = image.convert("RGBA").split()[-1]
-        bbox = alpha.getbbox()
-        return bbox
-    else:
-        # No alpha channel — the image is treated as fully opaque
-        return (0, 0, image.width, image.height)
+    with open(path, "rb") as f:
+        head = f.read(26)
+    if len(head) < 26 or head[:8] != PNG_SIGNATURE or head[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">IIBB", head[16:26])
+
+
+def is_icon_header(header: Tuple[int, int, int, int] | None, size: int) -> bool:
+    """True if header describes an 8-bit RGBA PNG that is already size x size."""
+    return header == (size, size, 8, PNG_COLOR_RGBA)
+
+
+def is_unchanged_copy(src_path: Path, dst_path: Path, size: int) -> bool:
+    """True if dst_path is the verbatim copy process_image made of an icon-shaped src_path.
+
+    Such copies keep the source's size and mtime, so this needs two stat calls
+    and a header read rather than a decode.
+    """
+    src_stat, dst_stat = src_path.stat(), dst_path.stat()
+    return (src_stat.st_size == dst_stat.st_size and src_stat.st_mtime_ns == dst_stat.st_mtime_ns
+            and is_icon_header(read_png_header(src_path), size))
+
+
+def get_alpha_bbox(arr: np.ndarray) -> Tuple[int, int, int, int] | None:
+    """Return the bounding box (l, upper, r, lower) of areas where alpha > 0
+    in an RGBA array. If the image is fully transparent, return None.
+
+    Works on row and column projections of the packed pixel words: alpha is
+    the high byte, so a row or column has content iff its largest word is
+    above RGB_MASK. Columns are only reduced over the rows that have content.
+    """
+    words = arr.view(RGBA_WORD).reshape(arr.shape[:2])
+    rows = words.max(axis=1) > RGB_MASK
+    if not rows.any():
+        return None
+    upper = int(rows.argmax())
+    lower = len(rows) - int(rows[::-1].argmax())
+    cols = words[upper:lower].max(axis=0) > RGB_MASK
+    left = int(cols.argmax())
+    right = len(cols) - int(cols[::-1].argmax())
+    return (left, upper, right, lower)
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def mask_background(arr, r, g, b, tolerance):
+        """Zero alpha where the RGB distance to (r, g, b) is at most tolerance * 3.
+
+        Returns the number of pixels cleared. Rows are split across threads.
+        """
+        height, width, _ = arr.shape
+        limit = tolerance * 3
+        count = 0
+        for y in prange(height):
+            for x in range(width):
+                d = (abs(np.int32(arr[y, x, 0]) - r)
+                     + abs(np.int32(arr[y, x, 1]) - g)
+                     + abs(np.int32(arr[y, x, 2]) - b))
+                if d <= limit:
+                    arr[y, x, 3] = 0
+                    count += 1
+        return count
+else:
+    def mask_background(arr: np.ndarray, r: int, g: int, b: int, tolerance: int) -> int:
+        """Zero alpha where the RGB distance to (r, g, b) is at most tolerance * 3.
+
+        Returns the number of pixels cleared.
+        """
+        bg = np.array((r, g, b), dtype=np.int16)
+        diff = np.abs(arr[:, :, :3].astype(np.int16) - bg).sum(axis=2)
+        mask = diff <= tolerance * 3
+        arr[mask, 3] = 0
+        return int(mask.sum())
+
+
+def load_rgba(path: Path, header: Tuple[int, int, int, int] | None = None) -> np.ndarray:
+    """Decode path once into a writable (height, width, 4) uint8 RGBA array.
+
+    header is path's read_png_header result. With OpenCV installed, 8-bit
+    PNGs are decoded straight into an ndarray, skipping the Pillow image and
+    the tobytes() copy out of it. Greyscale files (OpenCV drops their tRNS
+    colour key), 16-bit files, and everything without OpenCV go through Pillow.
+    """
+    if cv2 is not None and header is not None and header[2] == 8 and header[3] != PNG_COLOR_GRAY:
+        # np.fromfile + imdecode rather than imread, which can't open non-ASCII paths on Windows
+        arr = cv2.imdecode(np.fromfile(path, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+        if arr is None:
+            # Truncated or corrupt; Pillow would only fail on it a second time
+            raise OSError("cannot decode image file (truncated or corrupt)")
+        if arr.shape[2] == 3:
+            return cv2.cvtColor(arr, cv2.COLOR_BGR2RGBA)
+        return cv2.cvtColor(arr, cv2.COLOR_BGRA2RGBA, dst=arr)
+
+    with Image.open(path) as img:
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
+        return np.array(img, dtype=np.uint8)
+
+
+def background_on_border(arr: np.ndarray, tolerance: int = 0) -> bool:
+    """Return True if the top-left colour reappears elsewhere on the image border.
+
+    Only the four edge strips are inspected, so this costs O(width + height).
+    """
+    border = np.concatenate((arr[0, 1:], arr[-1], arr[1:, 0], arr[1:, -1]))
+    bg = arr[0, 0, :3].astype(np.int16)
+    diff = np.abs(border[:, :3].astype(np.int16) - bg).sum(axis=1)
+    return bool((diff <= tolerance * 3).any())
 
 
-def make_background_transparent(img: Image.Image, tolerance: int = 0) -> Image.Image:
-    """左上1pxの色を取得し、その色（と類似色）を透明にする。
-    
+def clear_background(arr: np.ndarray, tolerance: int = 0, name: str | None = None) -> None:
+    """左上1pxの色を取得し、その色（と類似色）の alpha を 0 にする（arr を直接書き換える）。
+
     Args:
-        img: 入力画像
+        arr: RGBA 画像の配列 (height, width, 4), uint8
         tolerance: 色の許容差（0=完全一致のみ、大きいほど曖昧に判定）
-    
-    Returns:
-        背景を透明にした画像
+        name: ログに付けるファイル名（並列実行時にどの画像の出力か分かるように）
     """
-    # RGBAに変換
-    if img.mode != "RGBA":
-        img = img.convert("RGBA")
-    
-    # 左上1pxの色を取得
-    bg_color = img.getpixel((0, 0))
-    
+    prefix = f"{name}: " if name else ""
+    bg_color = tuple(int(c) for c in arr[0, 0])
+
     # 既に透明なら何もしない
-    if len(bg_color) == 4 and bg_color[3] == 0:
-        print(f"  左上ピクセルは既に透明です。スキップします。")
-        return img
-    
-    print(f"  背景色検出: RGBA{bg_color}, 許容差: {tolerance}")
-    
-    # ピクセルデータを取得
-    pixels = img.load()
-    width, height = img.size
-    changed_count = 0
-    
-    for y in range(height):
-        for x in range(width):
-            current = pixels[x, y]
-            # RGB部分の差を計算
-            diff = sum(abs(current[i] - bg_color[i]) for i in range(3))
-            
-            if diff <= tolerance * 3:  # tolerance は各チャンネルあたりの許容差
-                pixels[x, y] = (current[0], current[1], current[2], 0)
-                changed_count += 1
-    
-    print(f"  透過ピクセル数: {changed_count} / {width * height}")
-    return img
-
-
-def trim_image(img: Image.Image) -> Image.Image:
-    bbox = get_alpha_bbox(img)
-    if bbox is None:
-        # fully transparent -> return original
-        return img
-    if bbox == (0, 0, img.width, img.height):
-        return img
-    return img.crop(bbox)
-
-
-def pad_to_square(img: Image.Image, background=(0, 0, 0, 0)) -> Image.Image:
-    width, height = img.size
-    size = max(width, height)
+    if bg_color[3] == 0:
+        log.info("  %s左上ピクセルは既に透明です。スキップします。", prefix)
+        return
+
+    # 外周の他の場所に同じ色が無ければ、左上は背景ではなく被写体の一部とみなす
+    if not background_on_border(arr, tolerance):
+        log.info("  %s左上ピクセルの色が外周の他の場所にありません。スキップします。", prefix)
+        return
+
+    log.info("  %s背景色検出: RGBA%s, 許容差: %d", prefix, bg_color, tolerance)
+
+    if tolerance == 0:
+        # 完全一致: 1ピクセル=1ワード(uint32)として RGB 24bit をまとめて比較する
+        words = arr.view(RGBA_WORD).reshape(arr.shape[:2])
+        mask = (words & RGB_MASK) == (words[0, 0] & RGB_MASK)
+        # alpha は最上位バイトなので、一致したワードを RGB_MASK と AND すれば 0 になる
+        np.bitwise_and(words, RGB_MASK, out=words, where=mask)
+        changed_count = np.count_nonzero(mask)
+    else:
+        # RGB差の合計が tolerance * 3 以下のピクセルを透明にする
+        # （tolerance は各チャンネルあたりの許容差）
+        changed_count = mask_background(arr, *bg_color[:3], tolerance)
+    height, width = arr.shape[:2]
 
-    # Ensure RGBA so we preserve alpha for transparent background
-    if img.mode != "RGBA":
-        img = img.convert("RGBA")
+    log.info("  %s透過ピクセル数: %d / %d", prefix, changed_count, width * height)
 
-    # Create a square background and paste centered
-    new_im = Image.new("RGBA", (size, size), background)
-    upper_left = ((size - width) // 2, (size - height) // 2)
-    new_im.paste(img, upper_left, img if img.mode == "RGBA" else None)
-    return new_im
 
+def trim_image(arr: np.ndarray, bbox: Tuple[int, int, int, int]) -> np.ndarray:
+    """Return arr cropped to bbox as a view (no copy)."""
+    left, upper, right, lower = bbox
+    return arr[upper:lower, left:right]
 
-def process_image(src_path: Path, dst_path: Path, size: int = DEFAULT_SIZE, tolerance: int = 0):
-    print(f"Processing {src_path} -> {dst_path}")
-    img = Image.open(src_path)
 
-    # Convert paletted images with transparency correctly
-    if img.mode == "P":
-        img = img.convert("RGBA")
+def pad_to_square(arr: np.ndarray) -> np.ndarray:
+    """Center an RGBA array on a transparent square canvas.
 
-    # 背景色を透明にする（左上1pxが不透明な場合）
-    img = make_background_transparent(img, tolerance)
+    The canvas is fully transparent, so a plain slice copy gives the same
+    result as alpha-compositing with Image.paste, at memcpy cost.
+    """
+    height, width = arr.shape[:2]
+    size = max(width, height)
+    if width == height:
+        return arr
+
+    out = np.zeros((size, size, 4), dtype=np.uint8)
+    upper, left = (size - height) // 2, (size - width) // 2
+    out[upper:upper + height, left:left + width] = arr
+    return out
+
+
+def resize_backend() -> str:
+    """Describe which library resize_square will use for downscaling."""
+    if cv2 is not None:
+        return f"OpenCV {cv2.__version__} (INTER_AREA)"
+    # Pillow-SIMD releases carry a ".postN" suffix on the upstream version
+    name = "Pillow-SIMD" if ".post" in PIL.__version__ else "Pillow"
+    return f"{name} {PIL.__version__} (LANCZOS)"
 
-    # Trim transparent margins
-    trimmed = trim_image(img)
 
-    # Pad to square with transparent background
-    squared = pad_to_square(trimmed)
+def square_box(bbox: Tuple[int, int, int, int], width: int,
+               height: int) -> Tuple[float, float, float, float] | None:
+    """Return the square box, in source coordinates, centred on bbox.
+
+    Returns None when the square would extend outside the width x height
+    image.
+    """
+    left, upper, right, lower = bbox
+    side = max(right - left, lower - upper)
+    cx = (left + right) / 2
+    cy = (upper + lower) / 2
+    box = (cx - side / 2, cy - side / 2, cx + side / 2, cy + side / 2)
+    if box[0] < 0 or box[1] < 0 or box[2] > width or box[3] > height:
+        return None
+    return box
+
+
+def resize_square(arr: np.ndarray, size: int,
+                  box: Tuple[float, float, float, float] | None = None) -> Image.Image:
+    """Resize the square region box of an RGBA array (default: the whole,
+    already square array) to a size x size image.
+
+    Downscales go through OpenCV's INTER_AREA when it is installed; upscales
+    (and everything when OpenCV is missing) use Pillow's LANCZOS. A box that
+    is already size x size on whole pixels is cut out without resampling.
+    """
+    height, width = arr.shape[:2]
+    if box is None:
+        box = (0, 0, width, height)
+    if box[2] - box[0] == size and all(float(c).is_integer() for c in box):
+        left, upper = int(box[0]), int(box[1])
+        return Image.fromarray(np.ascontiguousarray(arr[upper:upper + size, left:left + size]), "RGBA")
+    if cv2 is None or box[2] - box[0] <= size:
+        # Image.resize premultiplies RGBA itself but then ignores reducing_gap,
+        # so do the RGBa round trip here
+        img = Image.fromarray(arr, "RGBA")
+        resized = img.convert("RGBa").resize((size, size), Image.LANCZOS, box=box, reducing_gap=REDUCING_GAP)
+        return resized.convert("RGBA")
+
+    # OpenCV has no sub-pixel source box; snap it to whole pixels
+    left, upper = round(box[0]), round(box[1])
+    side = min(round(box[2] - box[0]), width - left, height - upper)
+
+    # Resample premultiplied colour, as Pillow does, so fully transparent
+    # pixels don't bleed their RGB into the edges of the content
+    src = arr[upper:upper + side, left:left + side].astype(np.float32)
+    alpha = src[:, :, 3:] / 255.0
+    src[:, :, :3] *= alpha
+    out = cv2.resize(src, (size, size), interpolation=cv2.INTER_AREA)
+    alpha = out[:, :, 3:] / 255.0
+    np.divide(out[:, :, :3], alpha, out=out[:, :, :3], where=alpha > 0)
+    out = np.rint(np.clip(out, 0, 255)).astype(np.uint8)
+    return Image.fromarray(out, "RGBA")
+
+
+def read_source(src_path: Path) -> Tuple[Tuple[int, int, int, int] | None, np.ndarray]:
+    """Read and decode src_path: the I/O half of process_image."""
+    header = read_png_header(src_path)
+    return header, load_rgba(src_path, header)
+
+
+def make_icon(header: Tuple[int, int, int, int] | None, arr: np.ndarray, size: int = DEFAULT_SIZE,
+              tolerance: int = 0, name: str | None = None) -> Image.Image | None:
+    """Turn a decoded source into the size x size icon.
+
+    Returns None when the source already is that icon and can be copied
+    as-is. arr is modified in place; name labels the log messages.
+    """
+    corner_transparent = arr[0, 0, 3] == 0
+
+    # 背景色を透明にする（左上1pxが不透明な場合）
+    clear_background(arr, tolerance, name)
+
+    # Trim, pad and resize in one step by resampling a square box centred
+    # on the content straight from the source image
+    height, width = arr.shape[:2]
+    bbox = get_alpha_bbox(arr) or (0, 0, width, height)
+    box = square_box(bbox, width, height)
+
+    # Already a finished icon: nothing to clear and the resize would be the
+    # identity, so the file can be copied instead of re-encoded
+    if corner_transparent and is_icon_header(header, size) and box == (0, 0, size, size):
+        return None
+
+    if box is None:
+        # The square runs off the image: trim and pad to square instead
+        arr = pad_to_square(trim_image(arr, bbox))
+    else:
+        # Resample from the pixels under the box only. Along the long axis the
+        # box ends at the content's edge, and the kernel must clamp there as
+        # it does on a trimmed image instead of reading the margin past it
+        crop = (math.floor(box[0]), math.floor(box[1]), math.ceil(box[2]), math.ceil(box[3]))
+        arr = trim_image(arr, crop)
+        box = (box[0] - crop[0], box[1] - crop[1], box[2] - crop[0], box[3] - crop[1])
 
     # Resize to desired size
-    resized = squared.resize((size, size), Image.LANCZOS)
+    return resize_square(arr, size, box)
+
 
+def write_icon(src_path: Path, dst_path: Path, icon: Image.Image | None,
+               compress_level: int = DEFAULT_COMPRESS_LEVEL):
+    """Write icon to dst_path, or copy src_path (keeping its mtime) if icon is None."""
     # Ensure destination directory exists
     dst_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Save as PNG preserving transparency
-    resized.save(dst_path, "PNG")
+    if icon is None:
+        try:
+            shutil.copy2(src_path, dst_path)
+        except shutil.SameFileError:
+            # Processing in place (--src and --dst are the same folder): the
+            # source already is the finished icon
+            pass
+    else:
+        # Save as PNG preserving transparency
+        icon.save(dst_path, "PNG", compress_level=compress_level, optimize=False)
+
+
+def process_image(src_path: Path, dst_path: Path, size: int = DEFAULT_SIZE, tolerance: int = 0,
+                  compress_level: int = DEFAULT_COMPRESS_LEVEL):
+    # Decode once; background removal works on the array in place
+    header, arr = read_source(src_path)
+    write_icon(src_path, dst_path, make_icon(header, arr, size, tolerance, src_path.name), compress_level)
+
+
+def process_overlapped(tasks: List[Tuple[Path, Path]], size: int, tolerance: int,
+                       compress_level: int) -> Iterator[Tuple[Path, Path, str | None]]:
+    """Run process_image over tasks in this process, yielding results like process_one.
+
+    Two I/O threads read the next source and write the previous icon while
+    the current one is computed; Pillow and OpenCV release the GIL while
+    decoding and compressing. At most one read and one write are in flight.
+    """
+    def failed(future: Future) -> str | None:
+        error = future.exception()
+        return None if error is None else str(error)
+
+    with ThreadPoolExecutor(max_workers=2) as io:
+        next_read = io.submit(read_source, tasks[0][0]) if tasks else None
+        write = None
+        for i, (src_path, dst_path) in enumerate(tasks):
+            read = next_read
+            if i + 1 < len(tasks):
+                next_read = io.submit(read_source, tasks[i + 1][0])
+            try:
+                icon = make_icon(*read.result(), size, tolerance, src_path.name)
+            except Exception as e:
+                yield src_path, dst_path, str(e)
+                continue
+            if write is not None:
+                yield write[0], write[1], failed(write[2])
+            write = (src_path, dst_path, io.submit(write_icon, src_path, dst_path, icon, compress_level))
+        if write is not None:
+            yield write[0], write[1], failed(write[2])
+
+
+def process_one(task: Tuple[Path, Path], size: int, tolerance: int,
+                compress_level: int) -> Tuple[Path, Path, str | None]:
+    """Pool worker: process one (src, dst) task and return (src, dst, error message or None)."""
+    src_path, dst_path = task
+    try:
+        process_image(src_path, dst_path, size=size, tolerance=tolerance, compress_level=compress_level)
+    except Exception as e:
+        return src_path, dst_path, str(e)
+    return src_path, dst_path, None
+
+
+def warm_up_worker():
+    """Compile mask_background, or load it from Numba's on-disk cache, once
+    per worker instead of inside the first task (called from init_worker)."""
+    mask_background(np.zeros((1, 1, 4), dtype=np.uint8), 0, 0, 0, 0)
+
+
+def init_worker(queue: mp.Queue, level: int, warm_up: bool):
+    """Pool initializer: send this worker's log records to the main process
+    through queue, run OpenCV and Numba single-threaded, and optionally warm
+    up the Numba kernel."""
+    log.handlers[:] = [logging.handlers.QueueHandler(queue)]
+    log.setLevel(level)
+    log.propagate = False
+    # The pool already runs one worker per CPU; a full OpenCV or prange thread
+    # team in every worker would oversubscribe the machine
+    if cv2 is not None:
+        cv2.setNumThreads(1)
+    if njit is not None:
+        set_num_threads(1)
+    if warm_up:
+        warm_up_worker()
 
 
 def find_pngs(folder: Path):
@@ -146,35 +457,79 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--dst", type=str, default="icons", help="Destination folder for PNGs (default: icons)")
     parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="Output size (square, default: 256)")
     parser.add_argument("--tolerance", type=int, default=0, help="背景色の許容差 (0=完全一致, default: 0)")
+    parser.add_argument("--compress-level", type=int, default=DEFAULT_COMPRESS_LEVEL, choices=range(10),
+                        metavar="0-9", help="PNG zlib compression level (default: 1)")
+    parser.add_argument("--jobs", type=int, default=0, help="Worker processes (0 = one per CPU, default: 0)")
     parser.add_argument("--overwrite", action="store_true", help="Overwrite existing icons")
     parser.add_argument("--quiet", action="store_true", help="Suppress informational printing")
     return parser.parse_args()
 
 
+def setup_logging(quiet: bool) -> logging.Handler:
+    """Print log messages bare on stdout; --quiet keeps only failures."""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(handler)
+    log.setLevel(logging.WARNING if quiet else logging.INFO)
+    log.propagate = False
+    return handler
+
+
 def main():
     args = parse_args()
+    handler = setup_logging(args.quiet)
     src_dir = Path(args.src)
     dst_dir = Path(args.dst)
 
     pngs = find_pngs(src_dir)
-    if not args.quiet:
-        print(f"Found {len(pngs)} PNG files in {src_dir}")
-        print(f"Output will be placed into: {dst_dir}")
+    log.info("Found %d PNG files in %s", len(pngs), src_dir)
+    log.info("Output will be placed into: %s", dst_dir)
+    log.info("Resize backend: %s", resize_backend())
 
     if not pngs:
         return 0
 
+    tasks = []
     for p in pngs:
         target = dst_dir / p.name
         if target.exists() and not args.overwrite:
-            if not args.quiet:
-                print(f"Skipping {p.name} (exists). Use --overwrite to replace.")
+            log.info("Skipping %s (exists). Use --overwrite to replace.", p.name)
             continue
+        if target.exists() and not target.samefile(p) and is_unchanged_copy(p, target, args.size):
+            log.info("Skipping %s (already an icon, unchanged).", p.name)
+            continue
+        tasks.append((p, target))
 
-        try:
-            process_image(p, target, size=args.size, tolerance=args.tolerance)
-        except Exception as e:
-            print(f"Failed to process {p}: {e}")
+    jobs = min(args.jobs or os.cpu_count() or 1, len(tasks))
+    if jobs <= 1:
+        results = process_overlapped(tasks, args.size, args.tolerance, args.compress_level)
+        pool = listener = None
+    else:
+        # Windows and macOS cannot fork safely; be explicit about spawning there
+        ctx = mp.get_context("spawn" if sys.platform in ("win32", "darwin") else None)
+        # Workers queue their log records; only the main process writes to stdout
+        queue = ctx.Queue()
+        listener = logging.handlers.QueueListener(queue, handler)
+        listener.start()
+        # Only the Numba kernel has a start-up cost worth paying up front
+        warm_up = njit is not None and args.tolerance > 0
+        pool = ctx.Pool(jobs, initializer=init_worker, initargs=(queue, log.level, warm_up))
+        worker = functools.partial(process_one, size=args.size, tolerance=args.tolerance,
+                                   compress_level=args.compress_level)
+        chunksize = max(1, len(tasks) // (jobs * 4))
+        results = pool.imap_unordered(worker, tasks, chunksize=chunksize)
+
+    try:
+        for src_path, dst_path, error in results:
+            if error is not None:
+                log.error("Failed to process %s: %s", src_path, error)
+            else:
+                log.info("Processed %s -> %s", src_path, dst_path)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+            listener.stop()
 
     return 0
 